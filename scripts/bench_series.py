@@ -0,0 +1,79 @@
+"""Compare payload size and serialization time of the full vs compact series formats.
+
+Usage: python scripts/bench_series.py [--coins 50] [--days 1825] [--width 800]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from flask import Flask, render_template_string  # noqa: E402
+from series_codec import SeriesCodec  # noqa: E402
+
+
+def make_series(days: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    start = date(2020, 1, 1)
+    price, prices = 1000.0, []
+    for _ in range(days):
+        price *= math.exp(rng.gauss(0, 0.03))
+        prices.append(round(price, 4))
+
+    def ma(window):
+        return [round(sum(prices[max(0, i - window + 1):i + 1]) / min(window, i + 1), 4) for i in range(days)]
+
+    return {
+        "labels": [(start + timedelta(days=i)).isoformat() for i in range(days)],
+        "price": prices,
+        "ma7": ma(7),
+        "ma30": ma(30),
+        "rsi14": [round(rng.uniform(0, 100), 2) for _ in range(days)],
+    }
+
+
+def bench(name, fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    print(f"{name:<34} {len(out) / 1024:>10.1f} KiB {best * 1000:>9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--coins", type=int, default=50)
+    parser.add_argument("--days", type=int, default=1825)
+    parser.add_argument("--width", type=int, default=800)
+    args = parser.parse_args()
+
+    charts = {f"coin{i}": make_series(args.days, i) for i in range(args.coins)}
+    codec = SeriesCodec()
+
+    def compact(width=None):
+        return {c: codec.encode(codec.downsample(s, width)) for c, s in charts.items()}
+
+    app = Flask(__name__)
+
+    def jinja_tojson():
+        # what index.html used to embed via {{ charts | tojson }}
+        with app.app_context():
+            return render_template_string("{{ charts | tojson }}", charts=charts).encode("utf-8")
+
+    print(f"{args.coins} coins x {args.days} days, width={args.width}")
+    bench("full lists (Jinja tojson)", jinja_tojson)
+    bench("full lists (minified json)", lambda: codec.to_json_bytes(charts))
+    bench("full lists + gzip", lambda: codec.to_json_bytes(charts, compress=True))
+    bench("compact", lambda: codec.to_json_bytes(compact()))
+    bench("compact + gzip", lambda: codec.to_json_bytes(compact(), compress=True))
+    bench("downsample + compact", lambda: codec.to_json_bytes(compact(args.width)))
+    bench("downsample + compact + gzip", lambda: codec.to_json_bytes(compact(args.width), compress=True))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import gzip
+import json
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+
+class SeriesCodec:
+    """Downsample and compactly encode the series returned by TrendAnalyzer.get_series.
+
+    The compact format replaces ISO date labels with a start date plus day deltas,
+    and each float list with delta-encoded integers quantized to a fixed number of
+    decimals. Gaps (None) are kept as None and do not reset the running delta.
+    """
+
+    FORMAT = "compact-v1"
+
+    def __init__(self, price_decimals: int = 4, rsi_decimals: int = 2) -> None:
+        self.decimals = {
+            "price": price_decimals,
+            "ma7": price_decimals,
+            "ma30": price_decimals,
+            "rsi14": rsi_decimals,
+        }
+
+    @staticmethod
+    def downsample(series: Dict[str, Any], max_points: Optional[int]) -> Dict[str, Any]:
+        """Reduce a series to at most max_points using largest-triangle-three-buckets on price.
+
+        The same indices are kept for every list-valued key so labels and overlays stay
+        aligned; a missing price list, or a list whose length differs from labels,
+        raises ValueError.
+        """
+        labels = series.get("labels", [])
+        n = len(labels)
+        if n and not isinstance(series.get("price"), list):
+            raise ValueError("Series has no 'price' list to downsample on")
+        for key, values in series.items():
+            if isinstance(values, list) and len(values) != n:
+                raise ValueError(f"Series '{key}' has {len(values)} points, expected {n}")
+        if not max_points or n <= max_points or max_points < 3:
+            return series
+        y = [float(v) if v is not None else None for v in series["price"]]
+
+        keep = [0]
+        bucket = (n - 2) / (max_points - 2)
+        a = 0
+        for i in range(max_points - 2):
+            start = int(i * bucket) + 1
+            end = min(int((i + 1) * bucket) + 1, n - 1)
+            # average of the next bucket is the third triangle vertex
+            nxt_start, nxt_end = end, min(int((i + 2) * bucket) + 1, n)
+            nxt = [(j, y[j]) for j in range(nxt_start, nxt_end) if y[j] is not None]
+            if nxt:
+                avg_x = sum(j for j, _ in nxt) / len(nxt)
+                avg_y = sum(v for _, v in nxt) / len(nxt)
+            else:
+                avg_x, avg_y = float(n - 1), y[n - 1]
+            best, best_area = start, -1.0
+            ya = y[a]
+            for j in range(start, end):
+                if y[j] is None:
+                    continue
+                # without a known anchor or next-bucket average, fall back to the first real point
+                if ya is None or avg_y is None:
+                    area = 0.0
+                else:
+                    area = abs((a - avg_x) * (y[j] - ya) - (a - j) * (avg_y - ya))
+                if area > best_area:
+                    best, best_area = j, area
+            keep.append(best)
+            a = best
+        keep.append(n - 1)
+
+        out = dict(series)
+        for key, values in series.items():
+            if isinstance(values, list):
+                out[key] = [values[i] for i in keep]
+        return out
+
+    def encode(self, series: Dict[str, Any]) -> Dict[str, Any]:
+        """Encode a get_series dict into the compact, delta-encoded format."""
+        labels = series.get("labels", [])
+        ordinals = [date.fromisoformat(s).toordinal() for s in labels]
+        day_deltas = [b - a for a, b in zip(ordinals, ordinals[1:])]
+        encoded: Dict[str, Any] = {
+            "format": self.FORMAT,
+            "start": labels[0] if labels else None,
+            "day_deltas": day_deltas,
+            "decimals": dict(self.decimals),
+        }
+        for key, decimals in self.decimals.items():
+            encoded[key] = self._delta_encode(series.get(key, []), decimals)
+        return encoded
+
+    def decode(self, encoded: Dict[str, Any]) -> Dict[str, Any]:
+        """Inverse of encode; values are rounded to the encoded precision."""
+        labels: List[str] = []
+        if encoded.get("start"):
+            current = date.fromisoformat(encoded["start"])
+            labels.append(current.isoformat())
+            for step in encoded.get("day_deltas", []):
+                current += timedelta(days=step)
+                labels.append(current.isoformat())
+        decoded: Dict[str, Any] = {"labels": labels}
+        for key, decimals in encoded.get("decimals", self.decimals).items():
+            decoded[key] = self._delta_decode(encoded.get(key, []), decimals)
+        return decoded
+
+    @staticmethod
+    def _delta_encode(values: List[Optional[float]], decimals: int) -> List[Optional[int]]:
+        scale = 10 ** decimals
+        out: List[Optional[int]] = []
+        prev = 0
+        for v in values:
+            if v is None:
+                out.append(None)
+                continue
+            q = int(round(v * scale))
+            out.append(q - prev)
+            prev = q
+        return out
+
+    @staticmethod
+    def _delta_decode(deltas: List[Optional[int]], decimals: int) -> List[Optional[float]]:
+        scale = 10 ** decimals
+        out: List[Optional[float]] = []
+        acc = 0
+        for d in deltas:
+            if d is None:
+                out.append(None)
+                continue
+            acc += d
+            out.append(round(acc / scale, decimals))
+        return out
+
+    @staticmethod
+    def to_json_bytes(payload: Any, compress: bool = False) -> bytes:
+        """Serialize to minified JSON, optionally gzip-compressed."""
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return gzip.compress(raw, compresslevel=1) if compress else raw
@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 import pandas as pd
 import matplotlib
@@ -11,8 +11,8 @@ class TrendAnalyzer:
         self.prices_csv_path = prices_csv_path
         self.plots_dir = plots_dir
 
-    def _load_coin_df(self, coin: str) -> pd.DataFrame:
-        df = pd.read_csv(self.prices_csv_path)
+    def _load_coin_df(self, coin: str, all_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        df = pd.read_csv(self.prices_csv_path) if all_df is None else all_df
         if df.empty:
             return df
         df = df[df["coin"] == coin].copy()
@@ -57,7 +57,14 @@ class TrendAnalyzer:
 
     def get_series(self, coin: str, days: int = 30) -> Dict[str, Any]:
         """Return time-series for Chart.js: labels and datasets (price, ma7, ma30)."""
-        df = self._load_coin_df(coin)
+        return self._series_from_df(self._load_coin_df(coin), days)
+
+    def get_series_many(self, coins: List[str], days: int = 30) -> Dict[str, Dict[str, Any]]:
+        """Return get_series for several coins, reading the CSV only once."""
+        all_df = pd.read_csv(self.prices_csv_path)
+        return {coin: self._series_from_df(self._load_coin_df(coin, all_df), days) for coin in coins}
+
+    def _series_from_df(self, df: pd.DataFrame, days: int) -> Dict[str, Any]:
         if df.empty:
             return {"labels": [], "price": [], "ma7": [], "ma30": [], "rsi14": []}
         df = df.tail(days)
@@ -1,7 +1,9 @@
+import math
 import os
 from datetime import datetime
+from typing import Optional
 from dotenv import load_dotenv
-from flask import Flask, render_template, redirect, url_for, flash, request
+from flask import Flask, render_template, redirect, url_for, flash, request, Response, abort
 
 # Support running as a package (gunicorn src.web:app) and as a script/tests
 try:
@@ -9,11 +11,13 @@ try:
     from .data_logger import DataLogger
     from .trend_analyzer import TrendAnalyzer
     from .alert_engine import AlertEngine
+    from .series_codec import SeriesCodec
 except ImportError:  # fallback for direct script/tests
     from api_client import PriceFetcher
     from data_logger import DataLogger
     from trend_analyzer import TrendAnalyzer
     from alert_engine import AlertEngine
+    from series_codec import SeriesCodec
 
 
 ALIASES = {
@@ -46,6 +50,56 @@ def create_app() -> Flask:
     logger = DataLogger(prices_csv_path=prices_csv)
     analyzer = TrendAnalyzer(prices_csv_path=prices_csv, plots_dir=plots_dir)
     alerter = AlertEngine(prices_csv_path=prices_csv, alerts_json_path=alerts_json)
+    codec = SeriesCodec()
+    empty_series = {"labels": [], "price": [], "ma7": [], "ma30": [], "rsi14": []}
+
+    def _prepare_series(series: dict, currency: str, rate: float, width: Optional[int] = None) -> dict:
+        # Convert USD series to selected currency for display only
+        if currency != "usd" and rate != 1.0:
+            def _mul(arr):
+                return [round(x * rate, 4) if x is not None else None for x in arr]
+            series["price"] = _mul(series.get("price", []))
+            series["ma7"] = _mul(series.get("ma7", []))
+            series["ma30"] = _mul(series.get("ma30", []))
+        # Downsample server-side to the chart's pixel width when the client provides it
+        return codec.downsample(series, width)
+
+    def _positive_arg(name: str, default, cast):
+        raw = request.args.get(name)
+        if raw is None:
+            return default
+        try:
+            value = cast(raw)
+        except ValueError:
+            abort(400, description=f"{name} must be a number")
+        if not math.isfinite(value) or value <= 0:
+            abort(400, description=f"{name} must be positive")
+        return value
+
+    def _series_args():
+        """Parse and validate the query parameters shared by the series endpoints."""
+        days = _positive_arg("days", 30, int)
+        width = _positive_arg("width", None, int)
+        fmt = request.args.get("format", "full").lower()
+        if fmt not in ("full", "compact"):
+            abort(400, description="format must be 'full' or 'compact'")
+        currency = request.args.get("currency", default_currency).lower()
+        # index() passes its rate so charts match the KPIs without another lookup
+        rate = _positive_arg("rate", None, float)
+        if rate is None:
+            try:
+                rate = fetcher.get_usd_to(currency)
+            except Exception:
+                rate = 1.0
+        return days, width, fmt, currency, rate
+
+    def _json_response(payload) -> Response:
+        compress = request.accept_encodings["gzip"] > 0
+        resp = Response(codec.to_json_bytes(payload, compress=compress), mimetype="application/json")
+        if compress:
+            resp.headers["Content-Encoding"] = "gzip"
+        resp.headers["Vary"] = "Accept-Encoding"
+        return resp
 
     @app.route("/")
     def index():
@@ -59,7 +113,6 @@ def create_app() -> Flask:
         except Exception:
             latest = None
 
-        charts = {}
         kpis = {}
         rate = 1.0
         try:
@@ -69,34 +122,51 @@ def create_app() -> Flask:
 
         for coin in view_coins:
             try:
-                series = analyzer.get_series(coin, days=days)
-                # Convert USD series to selected currency for display only
-                if currency != "usd" and rate != 1.0:
-                    def _mul(arr):
-                        return [round(x * rate, 4) if x is not None else None for x in arr]
-                    series["price"] = _mul(series.get("price", []))
-                    series["ma7"] = _mul(series.get("ma7", []))
-                    series["ma30"] = _mul(series.get("ma30", []))
-                charts[coin] = series
                 kpi = analyzer.get_kpis(coin)
                 if currency != "usd" and rate != 1.0 and kpi.get("last_price") is not None:
                     kpi["last_price"] = round(kpi["last_price"] * rate, 4)
                 kpis[coin] = kpi
             except Exception:
-                charts[coin] = {"labels": [], "price": [], "ma7": [], "ma30": [], "rsi14": []}
                 kpis[coin] = {"last_price": None, "change_pct_1d": None}
 
         return render_template(
             "index.html",
             coins=view_coins,
             latest=latest,
-            charts=charts,
             kpis=kpis,
+            rate=rate,
             selected_days=days,
             currency=currency,
             now=datetime.utcnow(),
         )
 
+    @app.route("/api/series")
+    def api_series_batch():
+        """Series for several coins in one response, reading the CSV and rate once."""
+        days, width, fmt, currency, rate = _series_args()
+        user_coins = request.args.get("coins")
+        view_coins = coins if not user_coins else [normalize_coin_id(c) for c in user_coins.split(",") if c.strip()]
+        try:
+            many = analyzer.get_series_many(view_coins, days=days)
+        except Exception:
+            many = {coin: dict(empty_series) for coin in view_coins}
+        payload = {}
+        for coin, series in many.items():
+            series = _prepare_series(series, currency, rate, width)
+            payload[coin] = codec.encode(series) if fmt == "compact" else series
+        return _json_response(payload)
+
+    @app.route("/api/series/<coin>")
+    def api_series(coin):
+        """Series for one coin; format=compact returns delta-encoded, quantized values."""
+        days, width, fmt, currency, rate = _series_args()
+        try:
+            series = analyzer.get_series(normalize_coin_id(coin), days=days)
+        except Exception:
+            series = dict(empty_series)
+        series = _prepare_series(series, currency, rate, width)
+        return _json_response(codec.encode(series) if fmt == "compact" else series)
+
     @app.route("/fetch-log")
     def fetch_log():
         currency = request.args.get("currency", default_currency).lower()
@@ -0,0 +1,69 @@
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from series_codec import SeriesCodec
+
+
+def _series():
+    return {
+        "labels": ["2024-01-01", "2024-01-02", "2024-01-04", "2024-01-05"],
+        "price": [100.1234, 101.5, None, 99.0001],
+        "ma7": [100.1234, 100.8117, 100.8117, 100.2078],
+        "ma30": [100.1234, 100.8117, 100.8117, 100.2078],
+        "rsi14": [None, 100.0, 100.0, 37.5],
+    }
+
+
+def test_compact_roundtrip():
+    codec = SeriesCodec()
+    encoded = codec.encode(_series())
+    assert encoded["start"] == "2024-01-01"
+    assert encoded["day_deltas"] == [1, 2, 1]
+    assert all(v is None or isinstance(v, int) for v in encoded["price"])
+    assert codec.decode(json.loads(SeriesCodec.to_json_bytes(encoded))) == _series()
+
+
+def test_downsample_keeps_endpoints_and_alignment():
+    n = 1000
+    series = {
+        "labels": [f"2024-01-01+{i}" for i in range(n)],
+        "price": [float(i % 50) for i in range(n)],
+        "ma7": list(range(n)),
+        "ma30": list(range(n)),
+        "rsi14": list(range(n)),
+    }
+    out = SeriesCodec.downsample(series, 100)
+    assert len(out["labels"]) == 100
+    assert out["labels"][0] == series["labels"][0]
+    assert out["labels"][-1] == series["labels"][-1]
+    assert out["ma7"] == [int(lbl.split("+")[1]) for lbl in out["labels"]]
+    assert SeriesCodec.downsample(series, None) is series
+
+
+def test_to_json_bytes_gzip():
+    payload = SeriesCodec().encode(_series())
+    assert json.loads(gzip.decompress(SeriesCodec.to_json_bytes(payload, compress=True))) == payload
+
+
+def test_downsample_with_none_gaps():
+    n = 200
+    price = [None if i % 10 == 0 else float(i % 17) for i in range(n)]
+    series = {"labels": [str(i) for i in range(n)], "price": price, "extra": list(range(n))}
+    out = SeriesCodec.downsample(series, 20)
+    assert len(out["labels"]) == 20
+    assert out["extra"] == [int(lbl) for lbl in out["labels"]]
+    # interior buckets prefer real points over gaps
+    assert all(v is not None for v in out["price"][1:-1])
+
+
+def test_downsample_rejects_misaligned_lists():
+    with pytest.raises(ValueError):
+        SeriesCodec.downsample({"labels": ["a", "b", "c"], "price": [1.0, 2.0]}, 2)
+    with pytest.raises(ValueError):
+        SeriesCodec.downsample({"labels": [str(i) for i in range(10)], "ma7": list(range(10))}, 5)
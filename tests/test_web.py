@@ -0,0 +1,92 @@
+import gzip
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from series_codec import SeriesCodec
+
+EMPTY = {"labels": [], "price": [], "ma7": [], "ma30": [], "rsi14": []}
+
+
+def _client(tmp_path, monkeypatch, rows=None):
+    csv_path = tmp_path / "prices.csv"
+    if rows is not None:
+        lines = ["date,coin,price"] + [f"{d},{c},{p}" for d, c, p in rows]
+        csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    monkeypatch.setenv("PRICES_CSV", str(csv_path))
+    monkeypatch.setenv("USE_MOCK", "true")
+    monkeypatch.setenv("CURRENCY", "usd")
+    monkeypatch.setenv("COINS", "bitcoin,ethereum")
+    import web
+
+    return web.create_app().test_client()
+
+
+def _rows(n, coin="bitcoin", base=100.0):
+    return [(f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}", coin, base + i) for i in range(n)]
+
+
+def test_api_series_full_and_compact(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch, _rows(40))
+    full = client.get("/api/series/btc?days=30")
+    assert full.status_code == 200
+    assert full.headers["Vary"] == "Accept-Encoding"
+    assert "Content-Encoding" not in full.headers
+    data = full.get_json()
+    assert len(data["labels"]) == 30
+    assert client.get("/api/series/bitcoin").get_json() == data  # days defaults to 30
+
+    compact = client.get("/api/series/bitcoin?days=30&format=compact").get_json()
+    assert compact["format"] == SeriesCodec.FORMAT
+    assert SeriesCodec().decode(compact) == data
+    assert client.get("/api/series/dogecoin").get_json() == EMPTY
+
+
+def test_api_series_gzip_and_width(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch, _rows(100))
+    resp = client.get("/api/series/bitcoin?days=100&width=10", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert len(json.loads(gzip.decompress(resp.data))["labels"]) == 10
+
+    resp = client.get("/api/series/bitcoin", headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "Content-Encoding" not in resp.headers
+
+
+def test_api_series_currency_conversion(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch, _rows(5))
+    usd = client.get("/api/series/bitcoin?currency=usd").get_json()
+    # mock mode converts THB at 36, unless the page passes the rate it already resolved
+    thb = client.get("/api/series/bitcoin?currency=thb").get_json()
+    assert thb["price"] == [round(p * 36.0, 4) for p in usd["price"]]
+    assert thb["rsi14"] == usd["rsi14"]
+    fixed = client.get("/api/series/bitcoin?currency=thb&rate=2").get_json()
+    assert fixed["ma7"] == [round(p * 2.0, 4) for p in usd["ma7"]]
+
+
+def test_api_series_batch(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch, _rows(60) + _rows(60, "ethereum", 10.0))
+    resp = client.get("/api/series?coins=btc,eth,dogecoin&days=50&width=20&format=compact",
+                      headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    payload = json.loads(gzip.decompress(resp.data))
+    assert set(payload) == {"bitcoin", "ethereum", "dogecoin"}
+    assert len(SeriesCodec().decode(payload["ethereum"])["labels"]) == 20
+    assert SeriesCodec().decode(payload["dogecoin"])["labels"] == []
+    single = client.get("/api/series/ethereum?days=50&width=20&format=compact").get_json()
+    assert payload["ethereum"] == single
+    assert set(client.get("/api/series").get_json()) == {"bitcoin", "ethereum"}
+
+
+def test_api_series_missing_csv(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch)
+    assert client.get("/api/series/bitcoin").get_json() == EMPTY
+    assert client.get("/api/series?coins=bitcoin").get_json() == {"bitcoin": EMPTY}
+
+
+def test_api_series_bad_params(tmp_path, monkeypatch):
+    client = _client(tmp_path, monkeypatch, _rows(40))
+    for query in ("days=abc", "days=0", "width=-5", "rate=nan", "format=bogus"):
+        assert client.get(f"/api/series/bitcoin?{query}").status_code == 400, query
+        assert client.get(f"/api/series?{query}").status_code == 400, query